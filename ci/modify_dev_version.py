@@ -14,6 +14,8 @@ import datetime
 import re
 import sys
 
+_VERSION_RE = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+
 
 def add_timestamp_to_version(file_path):
     """
@@ -26,37 +28,38 @@ def add_timestamp_to_version(file_path):
         0 on success, 1 on error
     """
     try:
-        # Read the file
-        with open(file_path, "r") as f:
+        with open(file_path, "r+") as f:
             content = f.read()
 
-        # Find the version string
-        match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-        if not match:
-            print(f"Error: Couldn't find __version__ in {file_path}")
-            return 1
-
-        current_version = match.group(1)
-
-        # Remove existing dev suffix if present
-        if ".dev" in current_version:
-            base_version = current_version.split(".dev")[0]
-        else:
-            base_version = current_version
-
-        # Add timestamp
-        timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-        new_version = f"{base_version}.dev{timestamp}"
-
-        # Update the file
-        new_content = re.sub(
-            r'__version__\s*=\s*["\']([^"\']+)["\']',
-            f'__version__ = "{new_version}"',
-            content,
-        )
-
-        with open(file_path, "w") as f:
+            # Find the version string
+            match = _VERSION_RE.search(content)
+            if not match:
+                print(f"Error: Couldn't find __version__ in {file_path}")
+                return 1
+
+            current_version = match.group(1)
+
+            # Remove existing dev suffix if present
+            if ".dev" in current_version:
+                base_version = current_version.split(".dev")[0]
+            else:
+                base_version = current_version
+
+            # Add timestamp
+            timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+            new_version = f"{base_version}.dev{timestamp}"
+
+            if new_version == current_version:
+                print(f"Version already up to date: {current_version}")
+                return 0
+
+            # Update the file in place
+            new_content = _VERSION_RE.sub(
+                f'__version__ = "{new_version}"', content, count=1
+            )
+            f.seek(0)
             f.write(new_content)
+            f.truncate()
 
         print(f"Updated version: {current_version} → {new_version}")
         return 0
@@ -26,7 +26,7 @@ class Entity(ABC):
         return f"{self.icon} {self.entity_type}: {self.name}"
 
     def get_sections(self) -> list[Section]:
-        yield []
+        return []
 
     @group(fit=True)
     def get_content(self) -> list[Section]:
@@ -52,9 +52,10 @@ class Entity(ABC):
             return True
 
     def _measure_height(self, renderable, console: Console) -> int:
-        capture_console = Console()
+        # Measure with the console being printed to, at its full width, rather
+        # than setting up another one for every entity
         line_count = 1
-        for segment in capture_console.render(renderable, capture_console.options):
+        for segment in console.render(renderable, console.options):
             if segment.text:
                 line_count += segment.text.count("\n")
         return line_count
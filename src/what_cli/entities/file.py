@@ -1,26 +1,20 @@
+import codecs
 import grp
 import os
 import pwd
+import stat
+import struct
 from abc import ABC
-from dataclasses import dataclass
-from datetime import datetime
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Self, override
 
-import magic
-from ascii_magic import AsciiArt
-from mutagen import File as MutagenFile
-from mutagen.flac import FLAC
-from mutagen.mp3 import MP3
-from mutagen.mp4 import MP4
-from mutagen.oggvorbis import OggVorbis
-from PIL import Image
-from pygments import lexers
-from pymediainfo import MediaInfo
 from rich.align import Align
-from rich.console import Group, Text
-from rich.table import Table
+from rich.console import Text
 
+from .. import mediainfo, sniff
 from ..fields import (
     Bitrate,
     Code,
@@ -42,6 +36,234 @@ from ..fields import (
 )
 from .entity import Entity
 
+# Size of the blocks in which file content is scanned
+READ_CHUNK_SIZE = 1 << 20
+
+# Most bytes of content chardet is given to detect an encoding from
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Track details VideoFile shows, as pymediainfo attribute names mapped to the
+# MediaInfo parameters they come from
+VIDEO_TRACK_FIELDS = {
+    "Video": {
+        "duration": "Duration",
+        "width": "Width",
+        "height": "Height",
+        "format": "Format",
+        "frame_rate": "FrameRate",
+        "overall_bit_rate": "OverallBitRate",
+    },
+    "Audio": {"format": "Format"},
+}
+
+# Content samples decoded for language detection, by (device, inode,
+# modification time); _guess_language caches its answers per sample
+_SAMPLE_CACHE: dict[tuple[int, int, int], str] = {}
+
+# Characters of content that Pygments gets to guess a language from
+LANGUAGE_SAMPLE_LENGTH = 80 * 10
+
+# How much of an image is searched for its dimensions before asking PIL
+IMAGE_HEADER_SIZE = 64 * 1024
+
+# JPEG start-of-frame markers (the other 0xC_ values aren't frames)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Non text/* MIME types that libmagic gives to source and data files
+TEXT_APPLICATION_TYPES = frozenset(
+    {
+        "application/ecmascript",
+        "application/javascript",
+        "application/json",
+        "application/sql",
+        "application/toml",
+        "application/x-awk",
+        "application/x-httpd-php",
+        "application/x-ndjson",
+        "application/x-perl",
+        "application/x-php",
+        "application/x-ruby",
+        "application/x-sh",
+        "application/x-shellscript",
+        "application/x-tex",
+        "application/x-wine-extension-ini",
+        "application/x-yaml",
+        "application/xml",
+        "application/yaml",
+    }
+)
+
+
+def is_text_mime_type(mime: str) -> bool:
+    """Return True if the MIME type is one that can hold code"""
+    return (
+        mime.startswith("text/")
+        or mime in TEXT_APPLICATION_TYPES
+        or mime.endswith(("+json", "+xml"))
+    )
+
+
+@lru_cache(maxsize=1)
+def get_mime_detector():
+    """Return a libmagic handle, with its database loaded, shared by all files"""
+    import magic
+
+    return magic.Magic(mime=True)
+
+
+def detect_mime(path: str | os.PathLike) -> str:
+    """Return a file's MIME type, from its signature alone where that's enough"""
+    return sniff.sniff_file(path) or get_mime_detector().from_file(path)
+
+
+@lru_cache(maxsize=1)
+def get_audio_parsers() -> dict:
+    """Return mutagen's parsers for audio formats libmagic identifies, so that
+    mutagen needn't score those files against every format it knows"""
+    from mutagen.flac import FLAC
+    from mutagen.mp3 import MP3
+    from mutagen.mp4 import MP4
+
+    return {
+        "audio/flac": FLAC,
+        "audio/mp4": MP4,
+        "audio/mpeg": MP3,
+        "audio/x-flac": FLAC,
+        "audio/x-m4a": MP4,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _language_for_filename(filename: str) -> str | None:
+    """Return the name of the language implied by a file name, if any"""
+    from pygments import lexers
+    from pygments.util import ClassNotFound
+
+    try:
+        return lexers.get_lexer_for_filename(filename).name
+    except ClassNotFound:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _guess_language(sample: str) -> str | None:
+    """Return the name of the language Pygments guesses for a sample"""
+    from pygments import lexers
+
+    if lexer := lexers.guess_lexer(sample):
+        return lexer.name
+
+
+@lru_cache(maxsize=None)
+def _read_id_names(path: str) -> dict[int, str]:
+    """Return the id to name mapping from a passwd or group style file"""
+    names = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                parts = line.split(":")
+                if len(parts) > 2 and parts[2].isdigit():
+                    # The first entry wins, as it does for getpwuid/getgrgid
+                    names.setdefault(int(parts[2]), parts[0])
+    except OSError:
+        pass
+    return names
+
+
+@lru_cache(maxsize=1024)
+def _uid_to_name(uid: int) -> str:
+    """Return the user name for a uid, or the uid itself if unknown"""
+    if name := _read_id_names("/etc/passwd").get(uid):
+        return name
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=1024)
+def _gid_to_name(gid: int) -> str:
+    """Return the group name for a gid, or the gid itself if unknown"""
+    if name := _read_id_names("/etc/group").get(gid):
+        return name
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+def _read_text_sample(path: str | os.PathLike, length: int) -> str:
+    """Decode up to length characters from the start of a UTF-8 file"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Enough bytes for length characters, however many bytes each takes
+        raw = os.read(fd, length * 4)
+    finally:
+        os.close(fd)
+    # Tolerate a character cut off at the end, but not invalid UTF-8
+    text = codecs.getincrementaldecoder("utf-8")().decode(raw)
+    # Translate newlines as reading in text mode would
+    return text.replace("\r\n", "\n").replace("\r", "\n")[:length]
+
+
+def _jpeg_size(header: bytes) -> tuple[int, int] | None:
+    """Find the dimensions in the first start-of-frame segment of a JPEG"""
+    position = 2
+    while position + 9 <= len(header):
+        if header[position] != 0xFF:
+            return None
+        marker = header[position + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            position += 1
+        elif marker in JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", header, position + 5)
+            return width, height
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Markers without a length or payload
+            position += 2
+        else:
+            (length,) = struct.unpack_from(">H", header, position + 2)
+            position += 2 + length
+    return None
+
+
+def _fast_image_size(path: str | os.PathLike) -> tuple[int, int] | None:
+    """Read an image's dimensions from its header, if it's a format we know"""
+    with open(path, "rb") as f:
+        header = f.read(IMAGE_HEADER_SIZE)
+
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        return struct.unpack_from(">II", header, 16)
+    if header[:6] in (b"GIF87a", b"GIF89a") and len(header) >= 10:
+        return struct.unpack_from("<HH", header, 6)
+    if header.startswith(b"\xff\xd8"):
+        return _jpeg_size(header)
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP" and len(header) >= 30:
+        chunk = header[12:16]
+        if chunk == b"VP8X":
+            width = int.from_bytes(header[24:27], "little") + 1
+            height = int.from_bytes(header[27:30], "little") + 1
+            return width, height
+        if chunk == b"VP8 ":
+            width, height = struct.unpack_from("<HH", header, 26)
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            bits = int.from_bytes(header[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    return None
+
+
+def is_file_or_directory(path: str, stat_result: os.stat_result) -> bool:
+    """Return True if the path is, or links to, a file or directory"""
+    mode = stat_result.st_mode
+    if stat.S_ISLNK(mode):
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            return False
+    return stat.S_ISREG(mode) or stat.S_ISDIR(mode)
+
 
 @dataclass(kw_only=True)
 class File(Entity):
@@ -50,8 +272,10 @@ class File(Entity):
     entity_type: str = "File"
     icon: str = "📄"
     path: Path
+    stat_result: os.stat_result | None = field(default=None, repr=False)
+    mime: str | None = field(default=None, repr=False)
 
-    @property
+    @cached_property
     def name(self) -> Path:
         """Return the file name"""
         return EntityName(name=self.path.name)
@@ -64,67 +288,62 @@ class File(Entity):
         else:
             return self.path.parent
 
-    @property
+    @cached_property
     def size(self) -> MemorySize:
         """Return the file size"""
         return MemorySize(bytes=self._stat.st_size)
 
-    @property
+    @cached_property
     def mime_type(self) -> str:
         """Return the file mime type"""
-        mime = magic.from_file(self.path, mime=True)
-        return mime
+        if self.mime is not None:
+            return self.mime
+        return detect_mime(self.path)
 
-    @property
+    @cached_property
     def _stat(self) -> os.stat_result:
         """Return the stat result for the file"""
-        return self.path.lstat()
+        if self.stat_result is not None:
+            return self.stat_result
+        return os.lstat(self.path)
 
-    @property
+    @cached_property
     def created(self) -> Timestamp:
         """Return the file creation time"""
-        return Timestamp(datetime.fromtimestamp(self._stat.st_ctime))
+        return Timestamp(self._stat.st_ctime)
 
-    @property
+    @cached_property
     def modified(self) -> Timestamp:
         """Return the file modification time"""
-        return Timestamp(datetime.fromtimestamp(self._stat.st_mtime))
+        return Timestamp(self._stat.st_mtime)
 
-    @property
+    @cached_property
     def accessed(self) -> Timestamp:
         """Return the file access time"""
-        return Timestamp(datetime.fromtimestamp(self._stat.st_atime))
+        return Timestamp(self._stat.st_atime)
 
-    @property
+    @cached_property
     def permissions(self) -> FilePermissions:
         return FilePermissions(self._stat.st_mode)
 
-    @property
+    @cached_property
     def owner(self) -> SystemUser:
         """Return the file owner"""
-        try:
-            return SystemUser(name=pwd.getpwuid(self._stat.st_uid).pw_name)
-        except KeyError:
-            return SystemUser(name=str(self._stat.st_uid))
+        return SystemUser(name=_uid_to_name(self._stat.st_uid))
 
-    @property
+    @cached_property
     def user_group(self) -> SystemUser:
         """Return the file group"""
-        try:
-            return SystemUser(name=grp.getgrgid(self._stat.st_gid).gr_name)
-        except KeyError:
-            return SystemUser(name=str(self._stat.st_gid))
-
-    def get_sections(self) -> list[Section]:
-        """Return sections for the file presentation"""
+        return SystemUser(name=_gid_to_name(self._stat.st_gid))
 
+    def get_sections(self) -> Iterator[Section]:
+        """Return sections for the file presentation, built as they're used"""
         yield self.get_basic()
         yield self.get_permissions()
         yield self.get_timestamps()
-
         yield from self.get_content_sections()
 
-    def get_basic(self) -> list[Section]:
+    def get_basic(self) -> Section:
         basic = Section("File")
         basic.add(LabelField("Name", self.name))
         self.add_path_fields(basic)
@@ -133,14 +352,14 @@ class File(Entity):
         basic.add(LabelField("Type", QuotedField(value=self.entity_type)))
         return basic
 
-    def get_permissions(self) -> list[Section]:
+    def get_permissions(self) -> Section:
         ownership = Section("Permissions")
         ownership.add(LabelField("Owner", self.owner))
         ownership.add(LabelField("Group", self.user_group))
         ownership.add(LabelField("RWX", self.permissions))
         return ownership
 
-    def get_timestamps(self) -> list[Section]:
+    def get_timestamps(self) -> Section:
         """Return sections for the file timestamps"""
         timestamps = Section("Timestamps")
         timestamps.add(LabelField("Created", self.created))
@@ -148,9 +367,9 @@ class File(Entity):
         timestamps.add(LabelField("Accessed", self.accessed))
         return timestamps
 
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         """Return sections for the file type-specific content"""
-        return []
+        yield from ()
 
     def add_path_fields(self, section):
         section.add(LabelField("Path", self.path))
@@ -160,15 +379,20 @@ class File(Entity):
     def match(cls, name: str) -> Self | None:
         """Match the file by its name"""
         abs_path = os.path.abspath(name)
-        if os.path.isfile(abs_path) or os.path.isdir(abs_path):
-            return FileFactory.from_path(abs_path)
+        try:
+            stat_result = os.lstat(abs_path)
+        except OSError:
+            return None
+
+        if is_file_or_directory(abs_path, stat_result):
+            return FileFactory.from_path(abs_path, stat_result)
         else:
             return None
 
 
 @dataclass
 class RegularFile(File, ABC):
-    def get_basic(self) -> list[Section]:
+    def get_basic(self) -> Section:
         basic = super().get_basic()
         basic.add(LabelField("MIME", self.mime_type))
         return basic
@@ -185,6 +409,12 @@ class ImageFile(RegularFile):
 
     def get_resolution(self) -> tuple[int, int]:
         """Return the image dimensions"""
+        size = _fast_image_size(self.path)
+        if size is not None:
+            return size
+
+        from PIL import Image
+
         with Image.open(self.path) as image:
             width, height = image.size
         return width, height
@@ -212,20 +442,21 @@ class ImageFile(RegularFile):
         return max(1, final_cols)
 
     @override
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         image_info = Section("Image Information")
         image_info.add(LabelField("Resolution", self.resolution))
         yield image_info
 
-    def get_art(self, cols) -> AsciiArt:
-        art = AsciiArt.from_image(self.path)
-        ascii_art = art.to_ascii(columns=cols)
-        grid = Table.grid()
-        [grid.add_column() for _ in range(cols)]
-        for row in ascii_art.splitlines():
-            row = Text.from_ansi(row)
-            grid.add_row(*row)
-        return grid
+    def get_art(self, cols) -> Text:
+        from ascii_magic import AsciiArt
+        from PIL import Image
+
+        with Image.open(self.path) as image:
+            # Each character only samples a pixel or two, so shrink the image
+            # (letting JPEGs decode at reduced scale) before converting it
+            image.thumbnail((cols * 2, image.height))
+            ascii_art = AsciiArt(image).to_ascii(columns=cols)
+        return Text.from_ansi(ascii_art.rstrip("\n"), no_wrap=True)
 
     @override
     def get_preview(self, max_height: int, max_width: int = 80):
@@ -239,7 +470,17 @@ class AudioFile(RegularFile):
     """Container for audio file information"""
 
     def __post_init__(self):
-        self._audio = MutagenFile(self.path)
+        from mutagen import File as MutagenFile
+        from mutagen import MutagenError
+
+        self._audio = None
+        if parser := get_audio_parsers().get(self.mime_type):
+            try:
+                self._audio = parser(self.path)
+            except MutagenError:
+                pass
+        if self._audio is None:
+            self._audio = MutagenFile(self.path)
 
     @property
     def duration(self) -> str:
@@ -262,6 +503,11 @@ class AudioFile(RegularFile):
 
     @property
     def audio_type(self) -> str:
+        from mutagen.flac import FLAC
+        from mutagen.mp3 import MP3
+        from mutagen.mp4 import MP4
+        from mutagen.oggvorbis import OggVorbis
+
         if isinstance(self._audio, MP3):
             format_name = "MP3"
         elif isinstance(self._audio, FLAC):
@@ -275,7 +521,7 @@ class AudioFile(RegularFile):
         return QuotedField(value=format_name)
 
     @override
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         audio_info = Section("Audio Information")
         audio_info.add(LabelField("Audio Format", self.audio_type))
         audio_info.add(LabelField("Duration", self.duration))
@@ -291,6 +537,15 @@ class VideoFile(RegularFile):
     """Container for video file information"""
 
     def __post_init__(self):
+        # Ask libmediainfo for just the fields shown where it can be called
+        # directly, rather than have pymediainfo parse a full XML report
+        if tracks := mediainfo.first_tracks(self.path, VIDEO_TRACK_FIELDS):
+            self._video_track = tracks["Video"]
+            self._audio_track = tracks["Audio"]
+            return
+
+        from pymediainfo import MediaInfo
+
         self._media_info = MediaInfo.parse(str(self.path))
         self._video_track = None
         self._audio_track = None
@@ -344,7 +599,7 @@ class VideoFile(RegularFile):
         return None
 
     @override
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         video_info = Section("Video Information")
         video_info.add(LabelField("Duration", self.duration))
         video_info.add(LabelField("Resolution", self.resolution))
@@ -360,39 +615,44 @@ class FileFactory:
     """Factory class for creating file objects"""
 
     @classmethod
-    def from_path(cls, file_path: str) -> File:
+    def from_path(
+        cls, file_path: str, stat_result: os.stat_result | None = None
+    ) -> File:
         path = Path(file_path)
+        # A single lstat serves both type dispatch and the File itself
+        if stat_result is None:
+            stat_result = os.lstat(path)
 
-        if file := cls.match_special_file(path):
+        if file := cls.match_special_file(path, stat_result):
             return file
         else:
-            return cls.match_regular_file(path)
+            return cls.match_regular_file(path, stat_result)
 
     @classmethod
-    def match_special_file(cls, path: Path) -> File:
-        if path.is_symlink():
-            return SymlinkFile(path=path)
-        elif path.is_dir():
-            return Directory(path=path)
+    def match_special_file(cls, path: Path, stat_result: os.stat_result) -> File:
+        if stat.S_ISLNK(stat_result.st_mode):
+            return SymlinkFile(path=path, stat_result=stat_result)
+        elif stat.S_ISDIR(stat_result.st_mode):
+            return Directory(path=path, stat_result=stat_result)
 
     @classmethod
-    def match_regular_file(cls, path: Path) -> File:
-        mime = magic.from_file(path, mime=True)
+    def match_regular_file(cls, path: Path, stat_result: os.stat_result) -> File:
+        mime = detect_mime(path)
 
         if cls.is_video_file(path, mime):
-            file = VideoFile(path=path)
+            file_type = VideoFile
         elif cls.is_audio_file(path, mime):
-            file = AudioFile(path=path)
+            file_type = AudioFile
         elif cls.is_image_file(path, mime):
-            file = ImageFile(path=path)
+            file_type = ImageFile
         elif cls.is_plain_text_file(path, mime):
-            file = TextFile(path=path)
-        elif CodeFile.match(path=path):
-            file = CodeFile(path=path)
+            file_type = TextFile
+        elif CodeFile.match(path=path, mime=mime):
+            file_type = CodeFile
         else:
-            file = RegularFile(path=path)
+            file_type = RegularFile
 
-        return file
+        return file_type(path=path, stat_result=stat_result, mime=mime)
 
     @classmethod
     def is_audio_file(cls, path: Path, mime: str) -> bool:
@@ -414,40 +674,89 @@ class FileFactory:
 @dataclass
 class TextFile(RegularFile, ABC):
 
-    def __post_init__(self):
-        from chardet.universaldetector import UniversalDetector
-
-        detector = UniversalDetector()
+    @cached_property
+    def _counts(self) -> dict:
+        """Scan the content once for its line and word counts and encoding"""
+        # Most text is ASCII or UTF-8, which can be confirmed by decoding it;
+        # chardet is only brought in for content that doesn't decode
+        utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        is_ascii = True
+        detector = None
+        detector_fed = 0
 
         line_count = 0
         word_count = 0
-        with open(self.path, "rb") as f:
-            for line in f:
-                line_count += 1
-                word_count += len(line.split())
-                if not detector.done:
-                    detector.feed(line)
-        detector.close()
+        last_byte = b"\n"
+        head = b""
+        with open(self.path, "rb", buffering=0) as f:
+            while chunk := f.read(READ_CHUNK_SIZE):
+                if len(head) < len(codecs.BOM_UTF8):
+                    head += chunk[: len(codecs.BOM_UTF8) - len(head)]
+                line_count += chunk.count(b"\n")
+                word_count += len(chunk.split())
+                # A word straddling two chunks has been counted twice
+                if not last_byte.isspace() and not chunk[:1].isspace():
+                    word_count -= 1
+                last_byte = chunk[-1:]
+                if detector is None:
+                    detector = self._check_utf8(chunk, utf8_decoder)
+                    is_ascii = is_ascii and detector is None and chunk.isascii()
+                if detector is not None and not detector.done:
+                    sample = chunk[: ENCODING_SAMPLE_SIZE - detector_fed]
+                    if sample:
+                        detector.feed(sample)
+                        detector_fed += len(sample)
+
+        # Count a final line that has no trailing newline
+        if last_byte != b"\n":
+            line_count += 1
+
+        if detector is not None:
+            detector.close()
+            encoding = detector.result["encoding"]
+        elif head and is_ascii:
+            encoding = "ascii"
+        elif head == codecs.BOM_UTF8:
+            encoding = "UTF-8-SIG"
+        else:
+            encoding = "utf-8"
+
+        return {
+            "line_count": line_count,
+            "word_count": word_count,
+            "encoding": encoding,
+        }
+
+    @staticmethod
+    def _check_utf8(chunk: bytes, decoder: codecs.IncrementalDecoder):
+        """Return None if a chunk continues valid UTF-8, or a chardet detector"""
+        # chardet reports escape-sequence encodings, and no encoding for ANSI
+        # colour codes, so leave anything with an escape byte to it
+        if b"\x1b" not in chunk:
+            try:
+                decoder.decode(chunk)
+                return None
+            except UnicodeDecodeError:
+                pass
 
-        self._line_count = line_count
-        self._word_count = word_count
+        from chardet.universaldetector import UniversalDetector
 
-        self._encoding = detector.result["encoding"]
+        return UniversalDetector()
 
     @property
     def line_count(self) -> int:
-        return NumberField(self._line_count)
+        return NumberField(self._counts["line_count"])
 
     @property
     def word_count(self) -> int:
-        return NumberField(self._word_count)
+        return NumberField(self._counts["word_count"])
 
     @property
     def encoding(self) -> str:
-        return QuotedField(value=self._encoding)
+        return QuotedField(value=self._counts["encoding"])
 
     @override
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         text_info = Section("Content Information")
         text_info.add(LabelField("Encoding", self.encoding))
         text_info.add(LabelField("Lines", self.line_count))
@@ -456,9 +765,7 @@ class TextFile(RegularFile, ABC):
 
     @override
     def get_preview(self, max_height):
-        code = Code(self.path)
-        preview_content = [code]
-        return Group(*preview_content)
+        return Code(self.path, max_lines=max_height)
 
 
 @dataclass
@@ -466,7 +773,7 @@ class SymlinkFile(File):
     entity_type: str = "Symlink"
     icon: str = "🔗"
 
-    @property
+    @cached_property
     def target(self) -> str:
         try:
             return os.readlink(self.path)
@@ -483,17 +790,24 @@ class Directory(File):
     entity_type: str = "Directory"
     icon: str = "📁"
 
-    def __post_init__(self):
-        self._items = list(self.path.iterdir())
+    @cached_property
+    def _items(self) -> list[tuple[str, bool, bool]]:
+        """Return (name, is_dir, is_file) for each entry, listing on first use"""
+        # scandir reads entry types from the directory listing itself, so
+        # only symlinks need a further stat to be classified
+        with os.scandir(self.path) as entries:
+            return [(entry.name, entry.is_dir(), entry.is_file()) for entry in entries]
 
     @property
     def summary(self) -> str:
-        files = sum(1 for item in self._items if item.is_file())
-        directories = sum(1 for item in self._items if item.is_dir())
+        files = directories = 0
+        for _, is_dir, is_file in self._items:
+            files += is_file
+            directories += is_dir
         return DirectorySummary(directories=directories, files=files)
 
     @override
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         directory_info = Section("Directory Information")
         directory_info.add(LabelField("Contains", self.summary))
         yield directory_info
@@ -504,13 +818,22 @@ class CodeFile(TextFile):
 
     @classmethod
     def get_language(cls, path: Path) -> str:
-        sample = path.read_text()[: (80 * 10)]
-        lexer = lexers.guess_lexer(sample)
-        if lexer:
-            return lexer.name
+        # Matching and rendering both ask, as may other links to the same file.
+        # The sample is decoded even when the name gives the language, as
+        # that is what keeps files that aren't UTF-8 out of CodeFile
+        stat_result = os.stat(path)
+        key = (stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns)
+        if key not in _SAMPLE_CACHE:
+            _SAMPLE_CACHE[key] = _read_text_sample(path, LANGUAGE_SAMPLE_LENGTH)
+
+        # A name like foo.py settles it without running every analyser
+        return _language_for_filename(path.name) or _guess_language(_SAMPLE_CACHE[key])
 
     @classmethod
-    def match(cls, path: Path):
+    def match(cls, path: Path, mime: str | None = None):
+        # Don't read and analyse files libmagic already knows aren't text
+        if mime is not None and not is_text_mime_type(mime):
+            return False
         try:
             matched_a_language = bool(cls.get_language(path))
             return matched_a_language
@@ -522,7 +845,7 @@ class CodeFile(TextFile):
         return self.get_language(self.path)
 
     @override
-    def get_content_sections(self) -> list[Section]:
+    def get_content_sections(self) -> Iterator[Section]:
         code_info = Section("Code Information")
         code_info.add(LabelField("Language", self.language))
         code_info.add(LabelField("Encoding", self.encoding))
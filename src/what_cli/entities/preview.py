@@ -1,3 +1,5 @@
+from itertools import islice
+
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.segment import Segment
 from rich.style import Style
@@ -19,62 +21,22 @@ class Preview:
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         """Render the preview, truncating to max_height while preserving formatting"""
-        # Create a capture console to render the preview
-        capture_console = Console(
-            width=options.max_width,
-            height=None,
-            force_terminal=True,
-            color_system=console.color_system,
-            legacy_windows=console.legacy_windows,
-            _environ={},
-        )
-
-        # Render the content to segments
-        segments = list(capture_console.render(self.renderable, options))
-
-        # Group segments by line
-        lines = []
-        current_line = []
-
-        for segment in segments:
-            if segment.text and "\n" in segment.text:
-                parts = segment.text.split("\n")
-                # Add the first part to current line
-                if parts[0]:
-                    current_line.append(
-                        Segment(parts[0], segment.style, segment.control)
-                    )
-
-                # Handle middle parts
-                for i in range(1, len(parts) - 1):
-                    lines.append(current_line)
-                    current_line = []
-                    if parts[i]:
-                        current_line.append(
-                            Segment(parts[i], segment.style, segment.control)
-                        )
-
-                # Start new line with last part
-                lines.append(current_line)
-                current_line = []
-                if parts[-1]:
-                    current_line.append(
-                        Segment(parts[-1], segment.style, segment.control)
-                    )
-            else:
-                current_line.append(segment)
+        lines = Segment.split_lines(console.render(self.renderable, options))
+        shown = list(islice(lines, self.max_height))
 
-        # Don't forget the last line
-        if current_line:
-            lines.append(current_line)
+        # Renderables that know their full length needn't render all of it;
+        # for the rest, count whatever lines didn't fit
+        line_count = getattr(self.renderable, "line_count", None)
+        if line_count is None:
+            line_count = len(shown) + sum(1 for _ in lines)
 
         # Truncate to max_height
-        if len(lines) > self.max_height:
+        if line_count > self.max_height:
             # Take exactly max_height lines (indicator will replace the last one)
-            truncated_lines = lines[: self.max_height - 1]
+            truncated_lines = shown[: self.max_height - 1]
 
             # Calculate remaining lines
-            remaining_lines = len(lines) - len(truncated_lines)
+            remaining_lines = line_count - len(truncated_lines)
 
             # Create the line count indicator with styling
             label_str = f"+{remaining_lines} lines"
@@ -100,8 +62,8 @@ class Preview:
                     yield Segment("\n")
         else:
             # Yield all segments as is
-            for i, line in enumerate(lines):
+            for i, line in enumerate(shown):
                 for segment in line:
                     yield segment
-                if i < len(lines) - 1:  # Add newline except for last line
+                if i < len(shown) - 1:  # Add newline except for last line
                     yield Segment("\n")
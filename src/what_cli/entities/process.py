@@ -1,11 +1,13 @@
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Self, override
+from functools import cached_property
+from typing import Any, Self, override
 
 import psutil
 from psutil import Process as ProcessObj
 from rich.tree import Tree
 
+from .. import procfs
 from ..fields import (
     LabelField,
     MemorySize,
@@ -17,6 +19,29 @@ from ..fields import (
 )
 from .entity import Entity
 
+# Linux truncates /proc/<pid>/comm to this many characters
+COMM_LENGTH = 15
+
+# Shortest window over which CPU usage is measured
+CPU_SAMPLE_SECONDS = 0.1
+
+# Most ancestors shown above a process, should its parents ever form a loop
+MAX_LINEAGE_DEPTH = 64
+
+# Process details fetched together in one psutil.Process.as_dict call
+INFO_ATTRS = [
+    "name",
+    "status",
+    "create_time",
+    "memory_info",
+    "memory_percent",
+    "nice",
+    "cmdline",
+    "username",
+    "num_threads",
+    "io_counters",
+]
+
 
 @dataclass(kw_only=True)
 class Process(Entity):
@@ -26,98 +51,122 @@ class Process(Entity):
     icon: str = "⚙️ "
     process: ProcessObj
 
+    def __post_init__(self):
+        # Start measuring CPU usage now, so the sample window overlaps
+        # with the rest of the work done before it is displayed
+        self._cpu_sample_start = time.monotonic()
+        self.process.cpu_percent(interval=None)
+
     @override
     @classmethod
     def match(cls, name: str) -> Self | None:
-        def is_int(name: str) -> bool:
-            try:
-                int(name)
-                return True
-            except ValueError:
-                return False
-
         def find_process_by_pid(name: str) -> Process | None:
-            if is_int(name) and psutil.pid_exists(int(name)):
+            # Most names aren't PIDs; test rather than catch int()'s error.
+            # isdigit() alone would accept digits int() can't parse, like "²"
+            if name.isascii() and name.isdigit():
                 pid = int(name)
-                process = psutil.Process(pid)
-                return process
+                if psutil.pid_exists(pid):
+                    return psutil.Process(pid)
 
         def find_process_by_name(name: str) -> Process | None:
-            for process in psutil.process_iter(attrs=["pid", "name"]):
+            if psutil.LINUX:
+                return find_process_by_comm(name)
+            for process in psutil.process_iter(attrs=["name"]):
                 if process.info["name"] == name:
                     return process
 
+        def find_process_by_comm(name: str) -> Process | None:
+            # Read /proc/<pid>/comm directly so that only the matching
+            # process gets a psutil.Process built for it
+            for pid in procfs.pids():
+                comm = procfs.read_comm(pid)
+                if comm is None:
+                    continue
+                # comm is truncated to 15 characters, in which case
+                # psutil works out the full name for us
+                if comm == name or (len(comm) == COMM_LENGTH and name.startswith(comm)):
+                    try:
+                        process = psutil.Process(pid)
+                        if process.name() == name:
+                            return process
+                    except psutil.Error:
+                        continue
+
         if process := (find_process_by_pid(name) or find_process_by_name(name)):
             return cls(process=process)
 
-    @property
+    @cached_property
+    def _info(self) -> dict[str, Any]:
+        """Return the process details, read from the system in one pass"""
+        return self.process.as_dict(attrs=INFO_ATTRS)
+
+    @cached_property
     def name(self) -> str:
         """Return the process name"""
-        return f"[bold]{self.process.name()}[/]"
+        return f"[bold]{self._info['name']}[/]"
 
-    @property
+    @cached_property
     def pid(self) -> int:
         """Return the process ID"""
         return self.process.pid
 
-    @property
+    @cached_property
     def status(self) -> str:
         """Return the process status"""
-        return self.process.status()
+        return self._info["status"]
 
-    @property
+    @cached_property
     def started(self) -> str:
         """Return the process start time"""
-        return Timestamp(datetime.fromtimestamp(self.process.create_time()))
+        return Timestamp(self._info["create_time"])
 
-    @property
+    @cached_property
     def memory(self) -> MemorySize:
         """Return the process memory usage"""
         return NumberField(
-            self.process.memory_percent(),
+            self._info["memory_percent"],
             is_percentage=True,
-            hint=MemorySize(bytes=self.process.memory_info().rss),
+            hint=MemorySize(bytes=self._info["memory_info"].rss),
         )
 
-    @property
+    @cached_property
     def nice(self) -> int:
         """Return the process nice value"""
-        return self.process.nice()
+        return self._info["nice"]
 
     @property
     def cpu(self) -> float:
         """Return the process CPU usage"""
-        cpu = self.process.cpu_percent(interval=1)
+        elapsed = time.monotonic() - self._cpu_sample_start
+        if elapsed < CPU_SAMPLE_SECONDS:
+            time.sleep(CPU_SAMPLE_SECONDS - elapsed)
+        cpu = self.process.cpu_percent(interval=None)
         return NumberField(cpu, is_percentage=True)
 
-    @property
+    @cached_property
     def command(self) -> str:
         """Return the process command line"""
-        return " ".join(self.process.cmdline())
+        return " ".join(self._info["cmdline"] or [])
 
-    @property
+    @cached_property
     def user(self) -> str:
         """Return the process username"""
-        return SystemUser(name=self.process.username())
+        return SystemUser(name=self._info["username"])
 
-    @property
+    @cached_property
     def thread_count(self) -> int:
         """Return number of threads"""
-        try:
-            return len(self.process.threads())
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return 0
+        return self._info["num_threads"] or 0
 
-    @property
+    @cached_property
     def io_stats(self) -> dict[str, int]:
         """Return I/O statistics"""
-        try:
-            io = self.process.io_counters()
+        if io := self._info["io_counters"]:
             return {
                 "read_bytes": io.read_bytes,
                 "write_bytes": io.write_bytes,
             }
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        else:
             return {
                 "read_bytes": 0,
                 "write_bytes": 0,
@@ -151,12 +200,13 @@ class Process(Entity):
     def get_lineage(self) -> list[ProcessObj]:
         """Return a list of ancestor processes"""
         ancestors = [self.process]
-        current = ancestors[0]
-        while current.ppid() != 0:
+        # Each ppid() call re-reads /proc/<pid>/stat, so read it once a step
+        ppid = self.process.ppid()
+        while ppid != 0 and len(ancestors) < MAX_LINEAGE_DEPTH:
             try:
-                parent = psutil.Process(current.ppid())
+                parent = psutil.Process(ppid)
                 ancestors.append(parent)
-                current = parent
+                ppid = parent.ppid()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 break
         return list(reversed(ancestors))
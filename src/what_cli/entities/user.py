@@ -1,16 +1,36 @@
 import grp
+import os
 import pwd
 from dataclasses import dataclass
-from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Self, override
 
 import psutil
 
+from .. import procfs
 from ..fields import EntityName, LabelField, MemorySize, Section, SystemUser, Timestamp
 from .entity import Entity
 
 
+@lru_cache(maxsize=256)
+def _get_pwd_entry(username: str) -> pwd.struct_passwd | None:
+    """Return the password database entry for a user, or None if unknown"""
+    try:
+        return pwd.getpwnam(username)
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _get_group_name(gid: int) -> str:
+    """Return the name of a group, or its gid if it has no entry"""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
 @dataclass(kw_only=True)
 class User(Entity):
     """Container for user information"""
@@ -21,31 +41,40 @@ class User(Entity):
 
     def __post_init__(self):
         """Initialize the user information"""
-        try:
-            self.pwd_entry = pwd.getpwnam(self.username)
-        except KeyError:
+        self.pwd_entry = _get_pwd_entry(self.username)
+        if self.pwd_entry is None:
             self.errors.append(f"User '{self.username}' not found")
             return
 
-        # cache here to avoid multiple calls to psutil
-        self.processes = [
-            p.pid
-            for p in psutil.process_iter(["pid", "username"])
-            if p.info["username"] == self.username
-        ]
-        # Also cache
-        self.users = psutil.users()
+        # cache here to avoid multiple calls to psutil; psutil names a
+        # process's user from its real uid, so compare that directly rather
+        # than looking up a name for every process
+        uid = self.pwd_entry.pw_uid
+        if psutil.LINUX:
+            # Read each process's uid straight from /proc, so that only this
+            # user's processes get a psutil.Process built for them
+            self.processes = []
+            for pid in procfs.pids_for_uid(uid):
+                try:
+                    self.processes.append(psutil.Process(pid))
+                except psutil.NoSuchProcess:
+                    continue
+        else:
+            self.processes = [
+                p
+                for p in psutil.process_iter(["uids"])
+                if p.info["uids"] is not None and p.info["uids"].real == uid
+            ]
 
     @override
     @classmethod
     def match(cls, name: str) -> Self | None:
-        try:
-            pwd.getpwnam(name)
+        if _get_pwd_entry(name):
             return User(username=name)
-        except KeyError:
-            return False
+        else:
+            return None
 
-    @property
+    @cached_property
     def name(self) -> str:
         """Return the user's name"""
         # Try to get full name from GECOS field
@@ -64,23 +93,17 @@ class User(Entity):
         """Return the primary group ID"""
         return self.pwd_entry.pw_gid
 
-    @property
+    @cached_property
     def primary_group(self) -> str:
         """Return the primary group name"""
-        try:
-            return grp.getgrgid(self.pwd_entry.pw_gid).gr_name
-        except KeyError:
-            return str(self.pwd_entry.pw_gid)
+        return _get_group_name(self.pwd_entry.pw_gid)
 
-    @property
+    @cached_property
     def secondary_groups(self) -> list[str]:
         """Return list of secondary groups"""
-        groups = []
-        for group in grp.getgrall():
-            if self.username in group.gr_mem and group.gr_name != self.primary_group:
-                groups.append(group.gr_name)
-
-        return groups
+        # Ask NSS for just this user's groups rather than reading every group
+        gids = os.getgrouplist(self.username, self.gid)
+        return [_get_group_name(gid) for gid in dict.fromkeys(gids) if gid != self.gid]
 
     @property
     def home_directory(self) -> Path:
@@ -98,22 +121,23 @@ class User(Entity):
         # Common threshold for system users on Linux
         return self.uid < 1000
 
-    @property
+    @cached_property
     def is_logged_in(self) -> bool:
         """Return True if the user is currently logged in"""
-        return any(u.name == self.username for u in self.users)
+        return bool(self.login_sessions)
 
-    @property
+    @cached_property
     def login_sessions(self) -> list[dict]:
         """Return information about current login sessions"""
         sessions = []
-        for session in self.users:
+        # Read utmp once; is_logged_in is derived from these too
+        for session in psutil.users():
             if session.name == self.username:
                 sessions.append(
                     {
                         "terminal": session.terminal,
                         "host": session.host if hasattr(session, "host") else None,
-                        "started": Timestamp(datetime.fromtimestamp(session.started)),
+                        "started": Timestamp(session.started),
                     }
                 )
 
@@ -124,13 +148,14 @@ class User(Entity):
         """Return the number of processes owned by this user"""
         return len(self.processes)
 
-    @property
+    @cached_property
     def memory_usage(self) -> MemorySize:
         """Return the total memory used by this user's processes"""
         total_memory = 0
-        for pid in self.processes:
+        # Reuse the Process objects from the scan, rather than building new
+        # ones and having psutil re-read each start time to identify them
+        for process in self.processes:
             try:
-                process = psutil.Process(pid)
                 total_memory += process.memory_info().rss
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
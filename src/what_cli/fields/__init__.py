@@ -16,4 +16,5 @@ from .semantic import (
     SampleRate,
     SystemUser,
     Timestamp,
+    reference_time,
 )
@@ -1,14 +1,14 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from rich.console import Console, ConsoleOptions, RenderResult
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Field(ABC):
     hint: str | None = None
-    styles: str | list[str] = field(default_factory=list)
-    hint_styles: str | list[str] = field(default_factory=lambda: ["italic"])
+    styles: str | list[str] = ""
+    hint_styles: str | list[str] = "italic"
 
     @property
     @abstractmethod
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from rich.console import Console, ConsoleOptions, RenderResult
@@ -9,13 +10,24 @@ from rich.syntax import Syntax
 class Code:
     path: Path
     line_numbers: bool = True
+    # Highlight and render only this many lines from the start, if given
+    max_lines: int | None = None
+
+    @cached_property
+    def syntax(self) -> Syntax:
+        return Syntax.from_path(
+            self.path,
+            line_numbers=self.line_numbers,
+            line_range=(1, self.max_lines) if self.max_lines else None,
+        )
+
+    @property
+    def line_count(self) -> int:
+        """Return how many lines the code takes in full, however many are shown"""
+        return self.syntax.code.count("\n") + 1
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         """Rich console representation for the code"""
-        syntax = Syntax.from_path(
-            self.path,
-            line_numbers=self.line_numbers,
-        )
-        yield syntax
+        yield self.syntax
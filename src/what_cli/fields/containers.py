@@ -5,7 +5,7 @@ from rich.console import Console, ConsoleOptions, RenderResult
 from rich.table import Table
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelField:
     """Represents a name-value pair in a section"""
 
@@ -16,7 +16,7 @@ class LabelField:
         return f"{self.name}: {self.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Represents a section of related fields"""
 
@@ -1,6 +1,7 @@
 import stat
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar
 
 
 class Permission(Enum):
@@ -16,14 +17,21 @@ class Permission(Enum):
     @property
     def colour(self) -> str:
         """Return the color associated with the permission"""
-        if self == Permission.READ:
-            return "yellow"
-        elif self == Permission.WRITE:
-            return "red"
-        elif self == Permission.EXECUTE:
-            return "green"
-        else:
-            return "white"
+        return PERMISSION_COLOURS.get(self, "white")
+
+
+PERMISSION_COLOURS: dict[Permission, str] = {
+    Permission.READ: "yellow",
+    Permission.WRITE: "red",
+    Permission.EXECUTE: "green",
+}
+
+
+# How each permission is shown when its bit is set
+SET_MARKUP: dict[Permission, str] = {
+    permission: f"[{permission.colour}]{permission.value}[/]"
+    for permission in Permission
+}
 
 
 class PermissionType(Enum):
@@ -37,7 +45,7 @@ class PermissionType(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class FilePermission:
     """Represents a file permission bit"""
 
@@ -45,7 +53,7 @@ class FilePermission:
     permission_type: PermissionType
     value: bool
 
-    NOT_SET: str = "-"
+    NOT_SET: ClassVar[str] = "-"
 
     def __str__(self) -> str:
         return self.__rich__()
@@ -56,7 +64,7 @@ class FilePermission:
     def __rich__(self) -> str:
         """Rich representation for the permission bit"""
         if self:
-            return f"[{self.permission.colour}]{self.permission.value}[/]"
+            return SET_MARKUP[self.permission]
         else:
             return self.NOT_SET
 
@@ -73,24 +81,33 @@ PERMISSION_TO_MASK: dict[tuple[Permission, PermissionType], int] = {
     (Permission.EXECUTE, PermissionType.OTHER): stat.S_IXOTH,
 }
 
+# (permission, permission type, mask) for each bit, in display order
+_PERM_BITS: tuple[tuple[Permission, PermissionType, int], ...] = tuple(
+    (permission, permission_type, PERMISSION_TO_MASK[(permission, permission_type)])
+    for permission_type in PermissionType
+    for permission in Permission
+)
+
+# (mask, markup when set) for each bit, in display order
+_PERM_TABLE: tuple[tuple[int, str], ...] = tuple(
+    (mask, SET_MARKUP[permission]) for permission, _, mask in _PERM_BITS
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class FilePermissions:
     """Represents file permissions"""
 
     mode: int
 
     def __str__(self) -> str:
-        bits = self.get_bits()
-        return "".join(list(map(lambda b: b.__str__(), bits)))
+        return "".join(
+            markup if self.mode & mask else FilePermission.NOT_SET
+            for mask, markup in _PERM_TABLE
+        )
 
     def get_bits(self) -> list[FilePermission]:
-        bits = []
-        for permission_type in PermissionType:
-            for permission in Permission:
-                mask = PERMISSION_TO_MASK[(permission, permission_type)]
-                bit = self.mode & mask
-                permission_bit = FilePermission(permission, permission_type, bool(bit))
-                bits.append(permission_bit)
-
-        return bits
+        return [
+            FilePermission(permission, permission_type, bool(self.mode & mask))
+            for permission, permission_type, mask in _PERM_BITS
+        ]
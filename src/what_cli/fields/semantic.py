@@ -1,4 +1,6 @@
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from numbers import Number
 from pathlib import Path
@@ -9,20 +11,64 @@ from psutil import Process
 
 from .basic import Field
 
-
-@dataclass(kw_only=True)
+# The "now" that timestamps are described relative to, fixed for the
+# duration of a render by reference_time()
+_now: datetime | None = None
+
+
+@contextmanager
+def reference_time() -> Iterator[datetime]:
+    """Describe all timestamps created in this block relative to one moment"""
+    global _now
+    _now = datetime.now()
+    try:
+        yield _now
+    finally:
+        _now = None
+
+
+SIZE_SUFFIXES = ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB", "RB", "QB")
+BINARY_SUFFIXES = ("KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB", "RiB", "QiB")
+
+
+def natural_size(size: float, binary: bool = False, precision: int = 1) -> str:
+    """Format a byte count as humanize.naturalsize does, e.g. 1.2 MB, or with
+    binary=True 1.2 MiB"""
+    magnitude = abs(size)
+    if magnitude == 1:
+        return f"{int(size)} Byte"
+    base = 1024 if binary else 1000
+    if magnitude < base:
+        return f"{int(size)} Bytes"
+
+    suffixes = BINARY_SUFFIXES if binary else SIZE_SUFFIXES
+    if binary:
+        exponent = (int(magnitude).bit_length() - 1) // 10
+    else:
+        exponent = (len(str(int(magnitude))) - 1) // 3
+    exponent = min(exponent, len(suffixes))
+    # Rounding can carry into the next unit, e.g. 999,999 is 1.0 MB
+    if (
+        exponent < len(suffixes)
+        and float(f"{magnitude / base**exponent:.{precision}f}") >= base
+    ):
+        exponent += 1
+    return f"{size / base**exponent:.{precision}f} {suffixes[exponent - 1]}"
+
+
+@dataclass(kw_only=True, slots=True)
 class EntityName(Field):
     """Represents the name of an entity"""
 
     name: str
-    styles: str | list[str] = field(default_factory=lambda: "bold")
+    styles: str | list[str] = "bold"
 
     @property
     def content(self) -> str:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberField(Field):
     """Represents a number"""
 
@@ -41,22 +87,22 @@ class NumberField(Field):
             raise ValueError(f"Unsupported type: {type(self.value)}")
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class QuotedField(Field):
     """Represents a field with quotes"""
 
     value: str
-    styles: str | list[str] = field(default_factory=lambda: "italic")
+    styles: str | list[str] = "italic"
 
     @property
     def content(self) -> str:
         return self.value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PathUri(Field):
     path: Path
-    styles: str | list[str] = field(default_factory=lambda: "link")
+    styles: str | list[str] = "link"
 
     @property
     def content(self) -> str:
@@ -64,7 +110,7 @@ class PathUri(Field):
         return f"file://{encoded}"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProcessField(Field):
     process: Process
 
@@ -76,7 +122,7 @@ class ProcessField(Field):
         return self.process.name()
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySize(Field):
     """Represents a memory size"""
 
@@ -84,17 +130,16 @@ class MemorySize(Field):
 
     @property
     def content(self) -> str:
-        size_str = humanize.naturalsize(self.bytes)
-        return size_str
+        return natural_size(self.bytes)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SystemUser(Field):
     """Represents a system user or group"""
 
     name: str
 
-    styles: str | list[str] = field(default_factory=lambda: ["bold yellow"])
+    styles: str | list[str] = "bold yellow"
 
     @property
     def content(self) -> str:
@@ -102,19 +147,29 @@ class SystemUser(Field):
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Timestamp(Field):
-    timestamp: datetime
+    """Represents a moment, as a datetime or as seconds since the epoch"""
 
-    def __post_init__(self):
-        self.hint = humanize.naturaltime(self.timestamp)
+    timestamp: datetime | float
+
+    def as_datetime(self) -> datetime:
+        if isinstance(self.timestamp, datetime):
+            return self.timestamp
+        return datetime.fromtimestamp(self.timestamp)
 
     @property
     def content(self):
-        return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        return self.as_datetime().strftime("%Y-%m-%d %H:%M:%S")
+
+    def assemble_field(self):
+        # Only convert and describe the time once it's actually shown
+        if self.hint is None:
+            self.hint = humanize.naturaltime(self.as_datetime(), when=_now)
+        return Field.assemble_field(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DurationField(Field):
     """Represents a time duration"""
 
@@ -125,7 +180,7 @@ class DurationField(Field):
         return humanize.naturaldelta(self.seconds)
 
 
-@dataclass
+@dataclass(slots=True)
 class Resolution(Field):
     """Represents image/video resolution"""
 
@@ -137,7 +192,7 @@ class Resolution(Field):
         return f"{self.x} x {self.y}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Bitrate(Field):
     """Represents a bitrate value"""
 
@@ -145,10 +200,10 @@ class Bitrate(Field):
 
     @property
     def content(self) -> str:
-        return humanize.naturalsize(self.bps, binary=True, format="%.2f") + "/s"
+        return natural_size(self.bps, binary=True, precision=2) + "/s"
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleRate(Field):
     """Represents a sample rate value"""
 
@@ -159,7 +214,7 @@ class SampleRate(Field):
         return f"{self.hertz:,} Hz"
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameRate(Field):
     """Represents a frame rate value"""
 
@@ -170,7 +225,7 @@ class FrameRate(Field):
         return f"{self.fps:.2f} fps"
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorySummary(Field):
     directories: int
     files: int
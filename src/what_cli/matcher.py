@@ -13,4 +13,4 @@ def match(name, candidate_entities=None) -> Entity:
             return entity
 
     else:
-        raise Exception(f"No match found for {name}")
+        raise LookupError(f"No match found for {name}")
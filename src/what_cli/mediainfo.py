@@ -0,0 +1,125 @@
+"""Read a handful of fields from media files through libmediainfo's C API,
+rather than having pymediainfo generate and parse a full XML report"""
+
+import ctypes
+import importlib.util
+import os
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+
+# MediaInfo_stream_C and MediaInfo_info_C values, from MediaInfoDLL.h
+STREAM_KINDS = {"General": 0, "Video": 1, "Audio": 2}
+INFO_TEXT = 1
+INFO_NAME = 0
+
+# Passed as the stream number to count the streams of a kind
+ALL_STREAMS = ctypes.c_size_t(-1).value
+
+if sys.platform == "darwin":
+    LIBRARY_NAMES = ("libmediainfo.0.dylib", "libmediainfo.dylib")
+else:
+    LIBRARY_NAMES = ("libmediainfo.so.0",)
+
+
+def _library_paths() -> list[str]:
+    """Return where to look for libmediainfo, preferring pymediainfo's copy"""
+    paths = []
+    # Find pymediainfo's directory without paying to import it
+    if spec := importlib.util.find_spec("pymediainfo"):
+        for directory in spec.submodule_search_locations or []:
+            paths += [os.path.join(directory, name) for name in LIBRARY_NAMES]
+    return [path for path in paths if os.path.isfile(path)] + list(LIBRARY_NAMES)
+
+
+@lru_cache(maxsize=1)
+def _load_library():
+    """Return libmediainfo, or None if it can't be used here"""
+    # Windows builds use a different calling convention; leave them to
+    # pymediainfo
+    if os.name == "nt":
+        return None
+
+    for path in _library_paths():
+        try:
+            library = ctypes.CDLL(path)
+        except OSError:
+            continue
+        library.MediaInfo_New.argtypes = []
+        library.MediaInfo_New.restype = ctypes.c_void_p
+        library.MediaInfo_Open.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p]
+        library.MediaInfo_Open.restype = ctypes.c_size_t
+        library.MediaInfo_Count_Get.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_size_t,
+        ]
+        library.MediaInfo_Count_Get.restype = ctypes.c_size_t
+        library.MediaInfo_Get.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_size_t,
+            ctypes.c_wchar_p,
+            ctypes.c_int,
+            ctypes.c_int,
+        ]
+        library.MediaInfo_Get.restype = ctypes.c_wchar_p
+        library.MediaInfo_Close.argtypes = [ctypes.c_void_p]
+        library.MediaInfo_Close.restype = None
+        library.MediaInfo_Delete.argtypes = [ctypes.c_void_p]
+        library.MediaInfo_Delete.restype = None
+        return library
+    return None
+
+
+def _convert(value: str) -> int | float | str | None:
+    """Convert a field's text as pymediainfo would, numbers becoming numbers"""
+    if not value:
+        return None
+    for number_type in (int, float):
+        try:
+            return number_type(value)
+        except ValueError:
+            pass
+    return value
+
+
+def first_tracks(
+    path: str | os.PathLike, fields: dict[str, dict[str, str]]
+) -> dict[str, SimpleNamespace | None] | None:
+    """Return the first track of each stream kind in fields, which maps
+    attribute names to MediaInfo parameters, e.g. {"Video": {"width": "Width"}}
+
+    Kinds with no tracks map to None; returns None if libmediainfo can't be
+    used here."""
+    library = _load_library()
+    if library is None:
+        return None
+
+    handle = library.MediaInfo_New()
+    try:
+        if library.MediaInfo_Open(handle, os.fspath(path)) == 0:
+            if not os.path.exists(path):
+                raise FileNotFoundError(os.fspath(path))
+            raise RuntimeError(f"libmediainfo could not open {os.fspath(path)}")
+
+        tracks = {}
+        for kind, parameters in fields.items():
+            stream_kind = STREAM_KINDS[kind]
+            if library.MediaInfo_Count_Get(handle, stream_kind, ALL_STREAMS) == 0:
+                tracks[kind] = None
+                continue
+            tracks[kind] = SimpleNamespace(
+                **{
+                    attribute: _convert(
+                        library.MediaInfo_Get(
+                            handle, stream_kind, 0, parameter, INFO_TEXT, INFO_NAME
+                        )
+                    )
+                    for attribute, parameter in parameters.items()
+                }
+            )
+        return tracks
+    finally:
+        library.MediaInfo_Close(handle)
+        library.MediaInfo_Delete(handle)
@@ -0,0 +1,42 @@
+"""Scan Linux's /proc directly, for lookups across every process that would
+otherwise build a psutil.Process for each one"""
+
+import os
+from collections.abc import Iterator
+
+PROC = "/proc"
+
+
+def pids() -> Iterator[int]:
+    """Yield the ID of every process currently running"""
+    with os.scandir(PROC) as entries:
+        for entry in entries:
+            if entry.name.isdigit():
+                yield int(entry.name)
+
+
+def read_comm(pid: int) -> str | None:
+    """Return a process's command name, or None if it has gone"""
+    try:
+        with open(f"{PROC}/{pid}/comm", "rb") as f:
+            return os.fsdecode(f.read().rstrip(b"\n"))
+    except OSError:
+        return None
+
+
+def real_uid(pid: int) -> int | None:
+    """Return the real user ID of a process, or None if it has gone"""
+    try:
+        with open(f"{PROC}/{pid}/status", "rb") as f:
+            for line in f:
+                # Uid: real effective saved filesystem
+                if line.startswith(b"Uid:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def pids_for_uid(uid: int) -> list[int]:
+    """Return the IDs of the processes whose real user ID is uid"""
+    return [pid for pid in pids() if real_uid(pid) == uid]
@@ -0,0 +1,36 @@
+"""Recognise common media formats from their first bytes, without libmagic"""
+
+import os
+
+# Enough of a file to identify any of the formats below
+HEADER_SIZE = 16
+
+# RIFF containers, by the form type in bytes 8-12
+RIFF_TYPES = {
+    b"WEBP": "image/webp",
+    b"WAVE": "audio/x-wav",
+}
+
+
+def sniff_mime(header: bytes) -> str | None:
+    """Return the MIME type, as libmagic would report it, for a file starting
+    with header, if the format can be told from its signature alone"""
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        return "image/png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if header.startswith(b"\xff\xd8\xff") and len(header) > 3:
+        return "image/jpeg"
+    if header.startswith(b"RIFF"):
+        return RIFF_TYPES.get(header[8:12])
+    if header.startswith(b"fLaC"):
+        return "audio/flac"
+    if header.startswith(b"%PDF-"):
+        return "application/pdf"
+    return None
+
+
+def sniff_file(path: str | os.PathLike) -> str | None:
+    """Return the MIME type of a file from its signature, if recognised"""
+    with open(path, "rb") as f:
+        return sniff_mime(f.read(HEADER_SIZE))
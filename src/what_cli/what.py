@@ -5,6 +5,7 @@ from typing import Any
 from rich.console import Console
 
 from . import DESCRIPTION, matcher
+from .fields import reference_time
 
 console = Console()
 
@@ -30,23 +31,27 @@ def handle_args():
 
 def display(data: Any) -> None:
     # entities are responsible for their own display
-    console.print(data)
+    with reference_time():
+        console.print(data)
 
 
 def run():
-    """Match entity and display a summary"""
-    try:
-        args = handle_args()
-        name = args.name[0]
-
-        entity = matcher.match(name)
-        entity.args = args
-        display(entity)
-
-        return 0
-
-    except Exception as exception:
-        display("[red]" + str(exception) + "[/]")
-        if args.debug:
-            traceback.print_exc()
-        return 1
+    """Match each named entity and display a summary"""
+    args = handle_args()
+    status = 0
+
+    # Names repeated on the command line (e.g. by overlapping globs) are
+    # only looked up and displayed once
+    for name in dict.fromkeys(args.name):
+        try:
+            entity = matcher.match(name)
+            entity.args = args
+            display(entity)
+
+        except Exception as exception:
+            display("[red]" + str(exception) + "[/]")
+            if args.debug:
+                traceback.print_exc()
+            status = 1
+
+    return status
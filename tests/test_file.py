@@ -0,0 +1,157 @@
+import io
+
+import pytest
+from what_cli.entities import file
+from what_cli.entities.file import CodeFile, TextFile
+
+CONTENTS = [
+    b"",
+    b"\n",
+    b"one",
+    b"one two\n",
+    b"one two\nthree",
+    b"  leading and trailing  \n\n",
+    b"tabs\tand\x0bother\x0cspace\r\nchars\rmore\n",
+    b"a\nbb\nccc dddd eeeee\n" * 50,
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1 << 20])
+@pytest.mark.parametrize("content", CONTENTS)
+def test_text_file_counts(tmp_path, monkeypatch, content, chunk_size):
+    monkeypatch.setattr(file, "READ_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "text.txt"
+    path.write_bytes(content)
+
+    text_file = TextFile(path=path)
+
+    lines = list(io.BytesIO(content))
+    assert text_file._counts["line_count"] == len(lines)
+    assert text_file._counts["word_count"] == sum(len(line.split()) for line in lines)
+
+
+def test_text_file_content_is_read_lazily(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_bytes(b"one two\n")
+
+    text_file = TextFile(path=path)
+    assert "_counts" not in text_file.__dict__
+
+    list(text_file.get_sections())
+    assert "_counts" in text_file.__dict__
+
+
+ENCODED_CONTENTS = [
+    b"",
+    b"plain ascii\n",
+    "caf\u00e9 na\u00efve \u2014 \u65e5\u672c\n".encode("utf-8"),
+    "\ufeffwith a byte order mark\n".encode("utf-8"),
+    "d\u00e9j\u00e0 vu, cr\u00e8me br\u00fbl\u00e9e\n".encode("latin-1") * 20,
+    b"\x1b[31mred\x1b[0m\n",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+@pytest.mark.parametrize("content", ENCODED_CONTENTS)
+def test_text_file_encoding_matches_chardet(tmp_path, monkeypatch, content, chunk_size):
+    from chardet.universaldetector import UniversalDetector
+
+    monkeypatch.setattr(file, "READ_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "text.txt"
+    path.write_bytes(content)
+
+    detector = UniversalDetector()
+    detector.feed(content)
+    detector.close()
+
+    assert TextFile(path=path)._counts["encoding"] == detector.result["encoding"]
+
+
+@pytest.mark.parametrize("sample_size", [1, 40, 1000])
+def test_text_file_encoding_detection_is_bounded(tmp_path, monkeypatch, sample_size):
+    from chardet.universaldetector import UniversalDetector
+
+    monkeypatch.setattr(file, "READ_CHUNK_SIZE", 16)
+    monkeypatch.setattr(file, "ENCODING_SAMPLE_SIZE", sample_size)
+    content = "na\u00efve caf\u00e9 \u00e0 la carte\n".encode("latin-1") * 50
+    path = tmp_path / "text.txt"
+    path.write_bytes(content)
+
+    detector = UniversalDetector()
+    detector.feed(content[:sample_size])
+    detector.close()
+
+    assert TextFile(path=path)._counts["encoding"] == detector.result["encoding"]
+
+
+def test_code_language_is_guessed_once_per_inode(tmp_path, monkeypatch):
+    path = tmp_path / "script"
+    path.write_text("#!/usr/bin/env python\nimport sys\nprint(sys.argv)\n")
+    link = tmp_path / "other-script"
+    link.hardlink_to(path)
+
+    language = CodeFile.get_language(path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("content read again")
+
+    monkeypatch.setattr(file, "_read_text_sample", fail)
+    assert CodeFile.get_language(path) == language
+    assert CodeFile.get_language(link) == language
+
+
+def test_code_file_rejects_non_utf8_source_with_known_name(tmp_path):
+    path = tmp_path / "latin.c"
+    path.write_bytes(
+        "/* caf\u00e9 */\nint main(void) { return 0; }\n".encode("latin-1")
+    )
+
+    assert not CodeFile.match(path, "text/x-c")
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["", "short\n", "x = 1\n" * 500, "\u00e9\u65e5" * 1000, "dos\r\nmac\r" * 200],
+)
+def test_read_text_sample_matches_read_text(tmp_path, content):
+    path = tmp_path / "sample.txt"
+    path.write_bytes(content.encode("utf-8"))
+
+    sample = file._read_text_sample(path, file.LANGUAGE_SAMPLE_LENGTH)
+
+    assert sample == path.read_text(encoding="utf-8")[: file.LANGUAGE_SAMPLE_LENGTH]
+
+
+def test_read_text_sample_rejects_invalid_utf8(tmp_path):
+    path = tmp_path / "sample.txt"
+    path.write_bytes(b"caf\xe9\n")
+
+    with pytest.raises(UnicodeDecodeError):
+        file._read_text_sample(path, file.LANGUAGE_SAMPLE_LENGTH)
+
+
+@pytest.mark.parametrize(
+    "format, mode",
+    [
+        ("PNG", "RGB"),
+        ("GIF", "P"),
+        ("JPEG", "RGB"),
+        ("JPEG", "L"),
+        ("WEBP", "RGB"),
+        ("WEBP", "RGBA"),
+    ],
+)
+@pytest.mark.parametrize("size", [(1, 1), (37, 5), (640, 480), (3000, 17)])
+def test_fast_image_size(tmp_path, format, mode, size):
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / f"image.{format.lower()}"
+    Image.new(mode, size).save(path, format)
+
+    assert file._fast_image_size(path) == size
+
+
+def test_fast_image_size_unknown_format(tmp_path):
+    path = tmp_path / "image.bmp"
+    path.write_bytes(b"BM" + bytes(100))
+
+    assert file._fast_image_size(path) is None
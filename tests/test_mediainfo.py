@@ -0,0 +1,46 @@
+import wave
+
+import pytest
+from what_cli import mediainfo
+
+FIELDS = {
+    "General": {"duration": "Duration", "overall_bit_rate": "OverallBitRate"},
+    "Audio": {"format": "Format", "bit_rate": "BitRate", "duration": "Duration"},
+    "Video": {"format": "Format"},
+}
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    path = tmp_path / "sound.wav"
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(bytes(44100 * 4 * 2))
+    return path
+
+
+def test_first_tracks_match_pymediainfo(wav_path):
+    if mediainfo._load_library() is None:
+        pytest.skip("libmediainfo can't be called directly here")
+    MediaInfo = pytest.importorskip("pymediainfo").MediaInfo
+
+    tracks = mediainfo.first_tracks(wav_path, FIELDS)
+
+    parsed = {}
+    for track in MediaInfo.parse(str(wav_path)).tracks:
+        parsed.setdefault(track.track_type, track)
+    assert tracks["Video"] is None
+    for kind in ("General", "Audio"):
+        for attribute in FIELDS[kind]:
+            expected = getattr(parsed[kind], attribute)
+            assert getattr(tracks[kind], attribute) == expected
+
+
+def test_first_tracks_missing_file(tmp_path):
+    if mediainfo._load_library() is None:
+        pytest.skip("libmediainfo can't be called directly here")
+
+    with pytest.raises(FileNotFoundError):
+        mediainfo.first_tracks(tmp_path / "missing.mp4", FIELDS)
@@ -0,0 +1,13 @@
+import pytest
+from what_cli.fields.permissions import FilePermissions
+
+
+def test_permissions_string():
+    assert str(FilePermissions(0o640)) == ("[yellow]r[/][red]w[/]-[yellow]r[/]-----")
+
+
+@pytest.mark.parametrize("mode", range(0o1000))
+def test_permissions_string_matches_bits(mode):
+    permissions = FilePermissions(mode)
+    rendered = "".join(str(bit) for bit in permissions.get_bits())
+    assert str(permissions) == rendered
@@ -0,0 +1,52 @@
+import pytest
+from rich.console import Console
+from rich.text import Text
+from what_cli.entities.preview import Preview
+from what_cli.fields import Code
+
+
+def render(renderable, width=40):
+    console = Console(width=width, force_terminal=False, color_system=None)
+    with console.capture() as capture:
+        console.print(renderable)
+    return capture.get().splitlines()
+
+
+@pytest.mark.parametrize("line_count", [1, 5, 10])
+def test_short_content_is_shown_in_full(line_count):
+    text = Text("\n".join(f"line {n}" for n in range(line_count)))
+
+    assert render(Preview(text, max_height=10)) == render(text)
+
+
+@pytest.mark.parametrize("line_count", [11, 12, 50])
+def test_long_content_is_truncated_with_a_count(line_count):
+    text = Text("\n".join(f"line {n}" for n in range(line_count)))
+
+    lines = render(Preview(text, max_height=10))
+
+    assert lines[:-1] == [f"line {n}" for n in range(8)]
+    assert lines[-1].startswith("...")
+    assert lines[-1].endswith(f"+{line_count - 9} lines")
+
+
+def test_styled_segments_split_across_lines_keep_their_text():
+    text = Text.assemble(("one\ntwo", "bold"), " three\nfour ", ("five\n\nsix", "red"))
+
+    assert render(Preview(text, max_height=10)) == render(text)
+
+
+@pytest.mark.parametrize("line_count", [0, 1, 9, 10, 11, 200])
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_code_rendered_up_to_max_lines_matches_full_render(
+    tmp_path, line_count, trailing_newline
+):
+    source = "\n".join(f"value_{n} = {n}  # comment" for n in range(line_count))
+    path = tmp_path / "code.py"
+    path.write_text(source + "\n" * trailing_newline)
+
+    limited = Preview(Code(path, max_lines=10), max_height=10)
+    full = Preview(Code(path), max_height=10)
+
+    assert render(limited, width=60) == render(full, width=60)
+    assert Code(path).line_count == len(render(Code(path), width=60))
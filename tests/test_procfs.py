@@ -0,0 +1,35 @@
+import os
+
+import psutil
+import pytest
+from what_cli import procfs
+
+pytestmark = pytest.mark.skipif(not psutil.LINUX, reason="needs Linux's /proc")
+
+
+def test_pids_include_this_process():
+    assert os.getpid() in procfs.pids()
+
+
+def test_read_comm_matches_psutil():
+    comm = procfs.read_comm(os.getpid())
+    assert psutil.Process().name().startswith(comm)
+
+
+def test_real_uid_matches_psutil():
+    assert procfs.real_uid(os.getpid()) == psutil.Process().uids().real
+
+
+def test_pids_for_uid_match_psutil():
+    uid = os.getuid()
+    expected = {
+        p.pid for p in psutil.process_iter(["uids"]) if p.info["uids"].real == uid
+    }
+    # Processes may come and go between the two scans
+    assert os.getpid() in procfs.pids_for_uid(uid)
+    assert len(expected.symmetric_difference(procfs.pids_for_uid(uid))) <= 2
+
+
+def test_missing_process():
+    assert procfs.read_comm(2**31 - 1) is None
+    assert procfs.real_uid(2**31 - 1) is None
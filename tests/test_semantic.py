@@ -0,0 +1,31 @@
+from datetime import datetime
+
+import humanize
+import pytest
+from what_cli.fields import Bitrate, MemorySize, Timestamp, reference_time
+
+SIZES = [0, 1, 2, 999, 1000, 1023, 1024, 1049, 1050, 99_949, 99_950, 999_949]
+SIZES += [999_950, 999_999, 10**6, 1_234_567, 10**9 - 1, 10**12, 10**28, 3 * 10**34]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_memory_size_matches_humanize(size):
+    assert MemorySize(bytes=size).content == humanize.naturalsize(size)
+
+
+BITRATES = [1, 2, 1023, 1024, 128_000, 320_000, 1_048_570, 1_048_575, 2**20]
+BITRATES += [4_500_000.5, 1024**4 - 1, 1024**10, 3 * 1024**11]
+
+
+@pytest.mark.parametrize("bps", BITRATES)
+def test_bitrate_matches_humanize(bps):
+    expected = humanize.naturalsize(bps, binary=True, format="%.2f") + "/s"
+    assert Bitrate(bps).content == expected
+
+
+@pytest.mark.parametrize("seconds", [0, 1_700_000_000.25, 2_000_000_000])
+def test_timestamp_from_seconds_matches_datetime(seconds):
+    with reference_time():
+        from_seconds = str(Timestamp(seconds))
+        from_datetime = str(Timestamp(datetime.fromtimestamp(seconds)))
+    assert from_seconds == from_datetime
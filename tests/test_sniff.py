@@ -0,0 +1,55 @@
+import io
+import wave
+
+import pytest
+from what_cli import sniff
+from what_cli.entities.file import get_mime_detector
+
+
+def image_bytes(format, mode="RGB"):
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.new(mode, (20, 10)).save(buffer, format)
+    return buffer.getvalue()
+
+
+def wav_bytes():
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(bytes(1000))
+    return buffer.getvalue()
+
+
+SAMPLES = {
+    "png": lambda: image_bytes("PNG"),
+    "gif": lambda: image_bytes("GIF", "P"),
+    "jpeg": lambda: image_bytes("JPEG"),
+    "webp": lambda: image_bytes("WEBP"),
+    "wav": wav_bytes,
+    "flac": lambda: b"fLaC\x00\x00\x00\x22" + bytes(34),
+    "pdf": lambda: b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n1 0 obj\n",
+}
+
+UNRECOGNISED = {
+    "text": b"just some text\n",
+    "truncated png": b"\x89PNG\r\n\x1a\n" + bytes(30),
+    "truncated jpeg": b"\xff\xd8\xff",
+    "avi": b"RIFF\x00\x00\x00\x00AVI LIST",
+    "empty": b"",
+}
+
+
+@pytest.mark.parametrize("name", SAMPLES)
+def test_sniff_matches_libmagic(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(SAMPLES[name]())
+
+    assert sniff.sniff_file(path) == get_mime_detector().from_file(str(path))
+
+
+@pytest.mark.parametrize("name", UNRECOGNISED)
+def test_sniff_leaves_others_to_libmagic(name):
+    assert sniff.sniff_mime(UNRECOGNISED[name]) is None